@@ -1,15 +1,21 @@
 import os
 import io
+import re
+import json
 import time
+import random
 import subprocess
 import google.auth
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date, timezone
 from email.utils import format_datetime
 import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape
 
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from googleapiclient.http import MediaIoBaseDownload
+from google.api_core.exceptions import NotFound, PreconditionFailed
 from google.cloud import storage
 
 
@@ -48,10 +54,49 @@ SPREADSHEET_ID = (
 
 SHEET_NAME = os.getenv("SHEET_NAME", "Main Schedule")
 
+# Bucket for the sheet header cache below. It holds
+# SPREADSHEET_ID, so in a public-read podcast bucket it is
+# world-readable. Set CACHE_BUCKET to a private bucket to keep
+# it out of public view.
+CACHE_BUCKET_NAME = (
+    os.getenv("CACHE_BUCKET")
+    or BUCKET_NAME
+)
+
+# Cache bucket object that holds the sheet's header row between runs.
+SHEET_HEADERS_BLOB_NAME = os.getenv(
+    "SHEET_HEADERS_BLOB_NAME",
+    "cache/sheet_headers.json",
+)
+
 # Optional override for backfills:
 # DATE_OVERRIDE=YYYY-MM-DD
 DATE_OVERRIDE = os.getenv("DATE_OVERRIDE")
 
+# Set MAKE_OBJECTS_PUBLIC=false when the bucket uses uniform
+# bucket-level access with public read. Per-object ACL calls are
+# then skipped, since they cannot succeed on such buckets.
+MAKE_OBJECTS_PUBLIC = os.getenv(
+    "MAKE_OBJECTS_PUBLIC",
+    "true",
+).strip().lower() not in (
+    "false",
+    "0",
+    "no",
+)
+
+# Optional hardware H.264 encoder for ffmpeg:
+# HWACCEL=nvenc|vaapi|none
+HWACCEL = os.getenv("HWACCEL", "none").strip().lower()
+
+# libx264 speed preset. A still image compresses well even at the
+# fastest setting.
+X264_PRESET = os.getenv("X264_PRESET", "ultrafast")
+
+# Cap encoder threads so small Cloud Run instances are not
+# oversubscribed.
+FFMPEG_THREADS = str(min(4, os.cpu_count() or 2))
+
 
 # -----------------------------
 # Authentication
@@ -134,52 +179,382 @@ def pick_existing_header(
     )
 
 
-def is_processed_value(value: str) -> bool:
-    return value.strip().lower() in (
+def resolve_schedule_columns(headers: list):
+    """
+    Match the schedule's header row to the columns main() uses.
+
+    Returns (col_index, columns) where col_index maps each header
+    to its zero-based position and columns maps each role to the
+    header found for it. Optional roles map to None.
+    """
+    col_index = {
+        header.strip(): index
+        for index, header in enumerate(headers)
+    }
+
+    COL_PUBLISH = pick_existing_header(
+        col_index,
+        "Publish Date",
+        "PublishDate",
+        "publish_date",
+    )
+
+    COL_TITLE = pick_existing_header(
+        col_index,
+        "Title",
+        "title",
+    )
+
+    COL_DESC = pick_existing_header(
+        col_index,
+        "Description",
+        "description",
+    )
+
+    COL_FILE = pick_existing_header(
+        col_index,
+        "File Name",
+        "FileName",
+        "Filename",
+        "file_name",
+    )
+
+    COL_PROCESSED = pick_existing_header(
+        col_index,
+        "Processed",
+        "processed",
+        "Status",
+        "status",
+    )
+
+    COL_THUMBNAIL = None
+
+    for candidate in (
+        "Thumbnail",
+        "thumbnail",
+    ):
+        if candidate in col_index:
+            COL_THUMBNAIL = candidate
+            break
+
+    COL_DRIVE_AUDIO_ID = None
+
+    for candidate in (
+        "DriveAudioFileId",
+        "DriveAudioFileID",
+    ):
+        if candidate in col_index:
+            COL_DRIVE_AUDIO_ID = candidate
+            break
+
+    COL_IMAGE_16x9 = pick_existing_header(
+        col_index,
+        "Image16x9FileId",
+        "Image16x9FileID",
+        "Image16x9FileIdField",
+        "Image16x9FileIdFiled",
+        "Image16x9FileIdFieldId",
+        "Image16x9FileIdFieldID",
+    )
+
+    columns = {
+        "publish": COL_PUBLISH,
+        "title": COL_TITLE,
+        "description": COL_DESC,
+        "file": COL_FILE,
+        "processed": COL_PROCESSED,
+        "thumbnail": COL_THUMBNAIL,
+        "drive_audio_id": COL_DRIVE_AUDIO_ID,
+        "image16x9": COL_IMAGE_16x9,
+    }
+
+    return col_index, columns
+
+
+# Lowercased Processed cell values that mark a row as done.
+PROCESSED_VALUES = frozenset(
+    {
         "yes",
         "y",
         "true",
         "1",
         "processed",
         "done",
+    }
+)
+
+
+def is_processed_value(value: str) -> bool:
+    return value.strip().lower() in PROCESSED_VALUES
+
+
+# -----------------------------
+# Google Sheets read helpers
+# -----------------------------
+def read_sheet_headers(
+    sheets_svc,
+    spreadsheet_id: str,
+    sheet_name: str,
+) -> list:
+    response = (
+        sheets_svc.spreadsheets()
+        .values()
+        .get(
+            spreadsheetId=spreadsheet_id,
+            range=f"'{sheet_name}'!1:1",
+        )
+        .execute(num_retries=5)
+    )
+
+    values = response.get(
+        "values",
+        [],
+    )
+
+    if not values:
+        return []
+
+    return values[0]
+
+
+def read_sheet_columns(
+    sheets_svc,
+    spreadsheet_id: str,
+    sheet_name: str,
+    column_indexes: list,
+    first_row: int = 2,
+    last_row: int = None,
+    with_headers: bool = False,
+):
+    """
+    Read only the requested columns and zip them back into rows.
+
+    Each returned row holds one value per requested column, in
+    the order given, padded with empty strings. Row N of the
+    result is sheet row first_row + N. Without last_row the read
+    runs to the end of the sheet.
+
+    With with_headers the full header row is fetched in the same
+    request and (headers, rows) is returned instead of rows.
+    """
+    end_row = "" if last_row is None else last_row
+
+    ranges = []
+
+    if with_headers:
+        ranges.append(f"'{sheet_name}'!1:1")
+
+    for column_index in column_indexes:
+        letter = col_to_a1(column_index)
+        ranges.append(
+            f"'{sheet_name}'!"
+            f"{letter}{first_row}:{letter}{end_row}"
+        )
+
+    response = (
+        sheets_svc.spreadsheets()
+        .values()
+        .batchGet(
+            spreadsheetId=spreadsheet_id,
+            ranges=ranges,
+            majorDimension="COLUMNS",
+        )
+        .execute(num_retries=5)
     )
 
+    value_ranges = response.get(
+        "valueRanges",
+        [],
+    )
+
+    if with_headers:
+        # COLUMNS major order returns the header row as one
+        # single-cell list per column.
+        headers = [
+            header_cell[0] if header_cell else ""
+            for header_cell in value_ranges[0].get(
+                "values",
+                [],
+            )
+        ]
+        value_ranges = value_ranges[1:]
+
+    columns = []
+
+    for value_range in value_ranges:
+        column_values = value_range.get(
+            "values",
+            [],
+        )
+        columns.append(
+            column_values[0] if column_values else []
+        )
+
+    if last_row is None:
+        row_count = max(
+            (len(column) for column in columns),
+            default=0,
+        )
+    else:
+        row_count = last_row - first_row + 1
+
+    rows = [
+        [
+            column[row_index]
+            if row_index < len(column)
+            else ""
+            for column in columns
+        ]
+        for row_index in range(row_count)
+    ]
+
+    if with_headers:
+        return headers, rows
+
+    return rows
+
+
+def load_cached_sheet_headers(
+    bucket,
+    blob_name: str,
+):
+    """
+    Return the header row cached by a previous run, or None.
+
+    The cache is ignored when it was written for a different
+    spreadsheet or tab. It is best-effort: any error reading it
+    is treated as a cache miss.
+    """
+    try:
+        payload = bucket.blob(blob_name).download_as_bytes(
+            timeout=30,
+            retry=storage.retry.DEFAULT_RETRY,
+        )
+
+        cached = json.loads(payload)
+
+        if (
+            cached.get("spreadsheet_id") != SPREADSHEET_ID
+            or cached.get("sheet_name") != SHEET_NAME
+        ):
+            return None
+
+        return cached.get("headers") or None
+    except NotFound:
+        return None
+    except Exception as error:
+        print(
+            "Could not load cached sheet headers. "
+            f"Continuing: {error}"
+        )
+        return None
+
+
+def save_cached_sheet_headers(
+    bucket,
+    blob_name: str,
+    headers: list,
+):
+    payload = json.dumps(
+        {
+            "spreadsheet_id": SPREADSHEET_ID,
+            "sheet_name": SHEET_NAME,
+            "headers": headers,
+        }
+    )
+
+    try:
+        bucket.blob(blob_name).upload_from_string(
+            payload,
+            content_type="application/json",
+            timeout=30,
+            retry=storage.retry.DEFAULT_RETRY,
+        )
+    except Exception as error:
+        print(
+            "Could not cache sheet headers. "
+            f"Continuing: {error}"
+        )
+
+
+def find_unprocessed_row(
+    scan_rows: list,
+    first_row: int,
+    today: date,
+):
+    """
+    Return the sheet row number of the first row scheduled for
+    today that is not yet processed, or None.
+
+    scan_rows holds (publish date, processed) pairs starting at
+    sheet row first_row.
+    """
+    today_iso = today.isoformat()
+
+    for row_offset, (publish_cell, processed_cell) in enumerate(
+        scan_rows
+    ):
+        publish_raw = publish_cell.strip()
+
+        # A plain string compare settles every YYYY-MM-DD cell.
+        # Only other spellings (such as 2026-3-2) are parsed, which
+        # is also where invalid dates get reported.
+        if publish_raw != today_iso:
+            if (
+                not publish_raw
+                or len(publish_raw) == len(today_iso)
+            ):
+                continue
+
+            try:
+                publish_date = parse_publish_date(
+                    publish_raw
+                )
+            except ValueError:
+                print(
+                    "Skipping row with invalid publish date: "
+                    f"row {first_row + row_offset}, "
+                    f"value {publish_raw!r}"
+                )
+                continue
+
+            if publish_date != today:
+                continue
+
+        if is_processed_value(processed_cell):
+            continue
+
+        return first_row + row_offset
+
+    return None
+
 
 # -----------------------------
 # Google Drive helpers
 # -----------------------------
+# (folder ID, file name) -> Drive file ID, so repeated lookups in
+# the same process skip the files.list call.
+_drive_file_id_cache = {}
+
+
 def drive_find_file_id(
     drive_svc,
     parent_folder_id: str,
     filename: str,
 ) -> str:
-    safe_name = filename.replace("'", "''")
-
-    query = (
-        f"name = '{safe_name}' "
-        f"and '{parent_folder_id}' in parents "
-        "and trashed = false"
-    )
-
-    result = (
-        drive_svc.files()
-        .list(
-            q=query,
-            fields="files(id,name)",
-            pageSize=1,
-        )
-        .execute(num_retries=5)
+    file_id = drive_find_file_id_optional(
+        drive_svc,
+        parent_folder_id,
+        filename,
     )
 
-    files = result.get("files", [])
-
-    if not files:
+    if not file_id:
         raise FileNotFoundError(
             "Drive file not found in folder "
             f"{parent_folder_id}: {filename}"
         )
 
-    return files[0]["id"]
+    return file_id
 
 
 def drive_find_file_id_optional(
@@ -190,6 +565,14 @@ def drive_find_file_id_optional(
     if not parent_folder_id or not filename:
         return None
 
+    cache_key = (
+        parent_folder_id,
+        filename,
+    )
+
+    if cache_key in _drive_file_id_cache:
+        return _drive_file_id_cache[cache_key]
+
     safe_name = filename.replace("'", "''")
 
     query = (
@@ -198,12 +581,14 @@ def drive_find_file_id_optional(
         "and trashed = false"
     )
 
+    # Only the ID is needed; the name is already known.
     result = (
         drive_svc.files()
         .list(
             q=query,
-            fields="files(id,name)",
+            fields="files(id)",
             pageSize=1,
+            spaces="drive",
         )
         .execute(num_retries=5)
     )
@@ -213,6 +598,8 @@ def drive_find_file_id_optional(
     if not files:
         return None
 
+    _drive_file_id_cache[cache_key] = files[0]["id"]
+
     return files[0]["id"]
 
 
@@ -220,7 +607,11 @@ def drive_download_file(
     drive_svc,
     file_id: str,
     out_path: str,
-):
+) -> int:
+    """
+    Download a Drive file to out_path and return the number of
+    bytes written.
+    """
     request = drive_svc.files().get_media(
         fileId=file_id,
     )
@@ -247,6 +638,52 @@ def drive_download_file(
                     f"{percentage}%"
                 )
 
+        return output_file.tell()
+
+
+def drive_download_files_parallel(
+    creds,
+    downloads: list,
+):
+    """
+    Download several Drive files at the same time.
+
+    downloads is a list of (file_id, out_path) pairs. Returns
+    the byte count of each download in the same order. The
+    httplib2 connection behind a Drive client is not thread-safe,
+    so each worker builds its own client.
+    """
+
+    def download(file_id: str, out_path: str) -> int:
+        worker_drive_svc = build_google_service(
+            "drive",
+            "v3",
+            creds,
+        )
+
+        return drive_download_file(
+            worker_drive_svc,
+            file_id,
+            out_path,
+        )
+
+    with ThreadPoolExecutor(
+        max_workers=len(downloads),
+    ) as executor:
+        futures = [
+            executor.submit(
+                download,
+                file_id,
+                out_path,
+            )
+            for file_id, out_path in downloads
+        ]
+
+        return [
+            future.result()
+            for future in futures
+        ]
+
 
 def resolve_thumbnail_file_id(
     drive_svc,
@@ -296,32 +733,111 @@ def resolve_thumbnail_file_id(
 # -----------------------------
 # Video rendering
 # -----------------------------
+# Audio in these containers is already AAC and can be copied
+# into the MP4 as-is.
+AAC_AUDIO_EXTENSIONS = (
+    ".m4a",
+    ".aac",
+    ".mp4",
+)
+
+
+def video_encoder_args(hwaccel: str):
+    """
+    Return (input_args, filter_suffix, encoder_args) for the
+    requested H.264 encoder. Unknown values fall back to libx264.
+    """
+    if hwaccel == "nvenc":
+        return (
+            [],
+            "",
+            [
+                "-c:v",
+                "h264_nvenc",
+                "-preset",
+                "p1",
+                "-pix_fmt",
+                "yuv420p",
+            ],
+        )
+
+    if hwaccel == "vaapi":
+        return (
+            [
+                "-vaapi_device",
+                "/dev/dri/renderD128",
+            ],
+            ",format=nv12,hwupload",
+            [
+                "-c:v",
+                "h264_vaapi",
+            ],
+        )
+
+    return (
+        [],
+        "",
+        [
+            "-c:v",
+            "libx264",
+            "-preset",
+            X264_PRESET,
+            "-tune",
+            "stillimage",
+            "-pix_fmt",
+            "yuv420p",
+        ],
+    )
+
+
 def run_ffmpeg(
     image_path: str,
     audio_path: str,
     out_video_path: str,
+    copy_audio: bool = False,
 ):
+    """
+    Render a still-image video for the episode audio.
+
+    The image is looped at one frame per second, which is all a
+    static picture needs. With copy_audio the AAC stream is muxed
+    without re-encoding.
+    """
+    input_args, filter_suffix, encoder_args = (
+        video_encoder_args(HWACCEL)
+    )
+
+    if copy_audio:
+        audio_args = [
+            "-c:a",
+            "copy",
+        ]
+    else:
+        audio_args = [
+            "-c:a",
+            "aac",
+            "-b:a",
+            "192k",
+        ]
+
     command = [
         "ffmpeg",
         "-y",
+        *input_args,
         "-loop",
         "1",
+        "-framerate",
+        "1",
         "-i",
         image_path,
         "-i",
         audio_path,
         "-vf",
-        "pad=ceil(iw/2)*2:ceil(ih/2)*2",
-        "-c:v",
-        "libx264",
-        "-tune",
-        "stillimage",
-        "-c:a",
-        "aac",
-        "-b:a",
-        "192k",
-        "-pix_fmt",
-        "yuv420p",
+        "pad=ceil(iw/2)*2:ceil(ih/2)*2" + filter_suffix,
+        *encoder_args,
+        "-threads",
+        FFMPEG_THREADS,
+        *audio_args,
         "-movflags",
         "+faststart",
         "-shortest",
@@ -342,30 +858,64 @@ def run_ffmpeg(
 
 
 # -----------------------------
-# RSS helpers
+# Cloud Storage helpers
 # -----------------------------
-def add_item_to_channel_newest_first(
-    channel: ET.Element,
-    item: ET.Element,
+def upload_public_file(
+    bucket,
+    blob_name: str,
+    local_path: str,
+    content_type: str,
+    timeout: int,
+    label: str,
 ):
     """
-    Insert the item before the first existing RSS item while
-    preserving the channel metadata above it.
+    Upload a local file and try to make it publicly readable.
+
+    label is only used for log messages (for example "audio").
     """
-    items = channel.findall("item")
+    print(
+        f"Uploading {label} to "
+        f"gs://{bucket.name}/{blob_name}"
+    )
 
-    if items:
-        first_item_index = list(channel).index(
-            items[0]
-        )
-        channel.insert(
-            first_item_index,
-            item,
+    blob = bucket.blob(
+        blob_name
+    )
+
+    blob.upload_from_filename(
+        local_path,
+        content_type=content_type,
+        timeout=timeout,
+        retry=storage.retry.DEFAULT_RETRY,
+    )
+
+    make_blob_public(
+        blob,
+        label,
+    )
+
+    return blob
+
+
+def make_blob_public(
+    blob,
+    label: str,
+):
+    if not MAKE_OBJECTS_PUBLIC:
+        return
+
+    try:
+        blob.make_public()
+    except Exception as error:
+        print(
+            f"Could not make {label} object public. "
+            f"Continuing: {error}"
         )
-    else:
-        channel.append(item)
 
 
+# -----------------------------
+# RSS helpers
+# -----------------------------
 def get_item_guid(item: ET.Element):
     guid_element = item.find("guid")
 
@@ -404,82 +954,236 @@ def remove_duplicate_items_for_guid(
         guid_value,
     )
 
-    if len(matching_items) <= 1:
-        return matching_items
+    if len(matching_items) <= 1:
+        return matching_items
+
+    kept_item = matching_items[0]
+    duplicates = matching_items[1:]
+
+    for duplicate in duplicates:
+        channel.remove(duplicate)
+
+    print(
+        f"Removed {len(duplicates)} duplicate RSS "
+        f"item(s) for GUID: {guid_value}"
+    )
+
+    return [kept_item]
+
+
+# Start of the first <item> element in a feed.
+FIRST_ITEM_PATTERN = re.compile(r"<item[\s>]")
+
+
+def add_item_to_feed(
+    rss_xml: str,
+    guid_value: str,
+    item_xml: str,
+):
+    """
+    Return rss_xml with item_xml added as the newest item, or
+    None when the feed already holds this GUID exactly once.
+
+    The item is spliced in before the first existing item, or
+    before </channel> if there is none, so the rest of the feed
+    keeps its exact text. Only a feed with duplicate copies of
+    the GUID is parsed, to remove the extra copies.
+    """
+    guid_count = rss_xml.count(
+        f">{escape(guid_value)}</guid>"
+    )
+
+    if guid_count == 1:
+        print(
+            "RSS item already exists. "
+            "Skipping duplicate insertion for GUID: "
+            f"{guid_value}"
+        )
+        return None
+
+    if guid_count > 1:
+        root = ET.fromstring(
+            rss_xml
+        )
+
+        channel = root.find("channel")
+
+        if channel is None:
+            raise RuntimeError(
+                "rss.xml is missing the <channel> element."
+            )
+
+        remove_duplicate_items_for_guid(
+            channel,
+            guid_value,
+        )
+
+        return ET.tostring(
+            root,
+            encoding="unicode",
+        )
+
+    first_item = FIRST_ITEM_PATTERN.search(
+        rss_xml
+    )
+
+    if first_item:
+        insert_at = first_item.start()
+    else:
+        insert_at = rss_xml.rfind("</channel>")
+
+        if insert_at == -1:
+            raise RuntimeError(
+                "rss.xml is missing the <channel> element."
+            )
+
+    print(
+        "Added new RSS item for GUID: "
+        f"{guid_value}"
+    )
+
+    return (
+        rss_xml[:insert_at]
+        + item_xml
+        + "\n\n"
+        + rss_xml[insert_at:]
+    )
+
+
+def fetch_rss_feed(rss_blob):
+    """
+    Return (rss_xml, generation) for the feed object.
+
+    The download is pinned to the generation read from the
+    object's metadata, so the text always matches that number.
+    """
+    rss_blob.reload(
+        timeout=120,
+        retry=storage.retry.DEFAULT_RETRY,
+    )
+
+    generation = rss_blob.generation
+
+    rss_xml = rss_blob.download_as_text(
+        if_generation_match=generation,
+        timeout=120,
+        retry=storage.retry.DEFAULT_RETRY,
+    )
+
+    return rss_xml, generation
 
-    kept_item = matching_items[0]
-    duplicates = matching_items[1:]
 
-    for duplicate in duplicates:
-        channel.remove(duplicate)
+def publish_rss_item(
+    rss_blob,
+    guid_value: str,
+    item_xml: str,
+    prefetched_feed=None,
+    max_attempts: int = 3,
+) -> bool:
+    """
+    Add the item to the feed and upload it, but only if rss.xml
+    has not changed since it was read.
+
+    If another run rewrote the feed in the meantime, the write is
+    rejected and the feed is read again after a short jittered
+    wait. prefetched_feed is an optional (rss_xml, generation)
+    pair from fetch_rss_feed(). Returns True when rss.xml was
+    rewritten.
+    """
+    feed = prefetched_feed
 
-    print(
-        f"Removed {len(duplicates)} duplicate RSS "
-        f"item(s) for GUID: {guid_value}"
-    )
+    for attempt in range(
+        1,
+        max_attempts + 1,
+    ):
+        try:
+            if feed is None:
+                feed = fetch_rss_feed(rss_blob)
 
-    return [kept_item]
+            rss_xml, generation = feed
 
+            updated_xml = add_item_to_feed(
+                rss_xml,
+                guid_value,
+                item_xml,
+            )
 
-def build_rss_item(
-    title: str,
-    description: str,
-    audio_url: str,
-    audio_size: int,
-    guid_value: str,
-):
-    item = ET.Element("item")
+            if updated_xml is None:
+                return False
 
-    ET.SubElement(
-        item,
-        "title",
-    ).text = title
+            rss_blob.upload_from_string(
+                updated_xml,
+                content_type="application/xml",
+                if_generation_match=generation,
+                timeout=120,
+                retry=storage.retry.DEFAULT_RETRY,
+            )
 
-    ET.SubElement(
-        item,
-        "description",
-    ).text = description
+            return True
 
-    ET.SubElement(
-        item,
-        "pubDate",
-    ).text = format_datetime(
-        datetime.now(timezone.utc)
-    )
+        except PreconditionFailed:
+            if attempt >= max_attempts:
+                raise
 
-    enclosure = ET.SubElement(
-        item,
-        "enclosure",
-    )
+            wait_seconds = random.uniform(
+                0.5,
+                1.5,
+            ) * attempt
 
-    enclosure.set(
-        "url",
-        audio_url,
-    )
+            print(
+                "rss.xml changed while it was being "
+                "updated. Reading it again in "
+                f"{wait_seconds:.1f} seconds."
+            )
 
-    enclosure.set(
-        "length",
-        str(audio_size),
-    )
+            time.sleep(wait_seconds)
 
-    enclosure.set(
-        "type",
-        "audio/x-m4a",
-    )
+            feed = None
 
-    guid = ET.SubElement(
-        item,
-        "guid",
+    raise RuntimeError(
+        "Unable to update rss.xml after "
+        f"{max_attempts} attempts."
     )
 
-    guid.set(
-        "isPermaLink",
-        "false",
-    )
 
-    guid.text = guid_value
+RSS_ITEM_TEMPLATE = (
+    "<item>"
+    "<title>{title}</title>"
+    "<description>{description}</description>"
+    "<pubDate>{pub_date}</pubDate>"
+    '<enclosure url="{audio_url}" length="{audio_size}" '
+    'type="audio/x-m4a" />'
+    '<guid isPermaLink="false">{guid}</guid>'
+    "</item>"
+)
+
+
+def build_rss_item(
+    title: str,
+    description: str,
+    audio_url: str,
+    audio_size: int,
+    guid_value: str,
+) -> str:
+    """
+    Return the serialized <item> element for a new episode.
 
-    return item
+    The item is a flat, fixed shape, so it is formatted from a
+    template instead of being built as an element tree.
+    """
+    return RSS_ITEM_TEMPLATE.format(
+        title=escape(title),
+        description=escape(description),
+        pub_date=format_datetime(
+            datetime.now(timezone.utc)
+        ),
+        audio_url=escape(
+            audio_url,
+            {'"': "&quot;"},
+        ),
+        audio_size=audio_size,
+        guid=escape(guid_value),
+    )
 
 
 # -----------------------------
@@ -652,16 +1356,19 @@ def main():
         today = parse_publish_date(
             DATE_OVERRIDE
         )
-        print(
-            "Using DATE_OVERRIDE: "
-            f"{today.isoformat()}"
-        )
+        date_source = "DATE_OVERRIDE"
     else:
         today = date.today()
-        print(
-            "Using current date: "
-            f"{today.isoformat()}"
-        )
+        date_source = "current date"
+
+    # Formatted once and reused for sheet matching, object
+    # names, the RSS GUID and the run state.
+    today_iso = today.isoformat()
+
+    print(
+        f"Using {date_source}: "
+        f"{today_iso}"
+    )
 
     initial_creds = get_creds()
 
@@ -685,179 +1392,184 @@ def main():
         BUCKET_NAME
     )
 
+    cache_bucket = storage_client.bucket(
+        CACHE_BUCKET_NAME
+    )
+
     # -----------------------------
     # Read Main Schedule
     # -----------------------------
-    sheet_response = (
-        sheets_svc.spreadsheets()
-        .values()
-        .get(
-            spreadsheetId=SPREADSHEET_ID,
-            range=f"'{SHEET_NAME}'!A1:Z",
-        )
-        .execute(num_retries=5)
-    )
-
-    values = sheet_response.get(
-        "values",
-        [],
-    )
-
-    if not values:
-        print("Sheet returned no data.")
-        return
-
-    headers = values[0]
-
-    col_index = {
-        header.strip(): index
-        for index, header in enumerate(headers)
-    }
-
-    COL_PUBLISH = pick_existing_header(
-        col_index,
-        "Publish Date",
-        "PublishDate",
-        "publish_date",
+    cached_headers = load_cached_sheet_headers(
+        cache_bucket,
+        SHEET_HEADERS_BLOB_NAME,
     )
 
-    COL_TITLE = pick_existing_header(
-        col_index,
-        "Title",
-        "title",
-    )
+    headers = None
 
-    COL_DESC = pick_existing_header(
-        col_index,
-        "Description",
-        "description",
-    )
+    if cached_headers:
+        try:
+            col_index, columns = resolve_schedule_columns(
+                cached_headers
+            )
 
-    COL_FILE = pick_existing_header(
-        col_index,
-        "File Name",
-        "FileName",
-        "Filename",
-        "file_name",
-    )
+            print("Using cached sheet headers.")
+            headers = cached_headers
+        except KeyError as error:
+            # A bad cached row must not block later runs, so it
+            # is treated as a miss and the live row is read.
+            print(
+                "Cached sheet headers are unusable. "
+                f"Reading them again: {error}"
+            )
 
-    COL_PROCESSED = pick_existing_header(
-        col_index,
-        "Processed",
-        "processed",
-        "Status",
-        "status",
-    )
+            cached_headers = None
 
-    COL_THUMBNAIL = None
+    if headers is None:
+        headers = read_sheet_headers(
+            sheets_svc,
+            SPREADSHEET_ID,
+            SHEET_NAME,
+        )
 
-    for candidate in (
-        "Thumbnail",
-        "thumbnail",
-    ):
-        if candidate in col_index:
-            COL_THUMBNAIL = candidate
-            break
+        if not headers:
+            print("Sheet returned no data.")
+            return
 
-    COL_IMAGE_16x9 = pick_existing_header(
-        col_index,
-        "Image16x9FileId",
-        "Image16x9FileID",
-        "Image16x9FileIdField",
-        "Image16x9FileIdFiled",
-        "Image16x9FileIdFieldId",
-        "Image16x9FileIdFieldID",
-    )
+        col_index, columns = resolve_schedule_columns(
+            headers
+        )
 
     # -----------------------------
     # Find first unprocessed row
     # -----------------------------
-    target_row = None
-    row_data = None
+    # Only the Publish Date and Processed columns are scanned.
+    # The remaining cells are fetched for the matching row alone.
+    # The live header row comes back in the same request and is
+    # used to check the cached copy.
+    live_headers, scan_rows = read_sheet_columns(
+        sheets_svc,
+        SPREADSHEET_ID,
+        SHEET_NAME,
+        [
+            col_index[columns["publish"]],
+            col_index[columns["processed"]],
+        ],
+        with_headers=True,
+    )
 
-    for row_index in range(
-        1,
-        len(values),
-    ):
-        row = values[row_index] + [""] * (
-            len(headers) - len(values[row_index])
-        )
+    if not live_headers:
+        print("Sheet returned no data.")
+        return
 
-        publish_raw = (
-            row[col_index[COL_PUBLISH]].strip()
-            if row[col_index[COL_PUBLISH]]
-            else ""
+    if live_headers != headers:
+        print(
+            "Sheet headers changed since they were "
+            "cached. Reading the schedule again."
         )
 
-        if not publish_raw:
-            continue
+        headers = live_headers
 
-        try:
-            publish_date = parse_publish_date(
-                publish_raw
-            )
-        except ValueError:
-            print(
-                "Skipping row with invalid publish date: "
-                f"row {row_index + 1}, "
-                f"value {publish_raw!r}"
-            )
-            continue
+        col_index, columns = resolve_schedule_columns(
+            headers
+        )
 
-        processed_raw = (
-            row[col_index[COL_PROCESSED]]
-            or ""
+        scan_rows = read_sheet_columns(
+            sheets_svc,
+            SPREADSHEET_ID,
+            SHEET_NAME,
+            [
+                col_index[columns["publish"]],
+                col_index[columns["processed"]],
+            ],
         )
 
-        already_processed = is_processed_value(
-            processed_raw
+    # Saved only once the live headers have resolved, so a
+    # broken header row is never cached.
+    if live_headers != cached_headers:
+        save_cached_sheet_headers(
+            cache_bucket,
+            SHEET_HEADERS_BLOB_NAME,
+            live_headers,
         )
 
-        if (
-            publish_date == today
-            and not already_processed
-        ):
-            target_row = row_index
-            row_data = row
-            break
+    COL_PUBLISH = columns["publish"]
+    COL_TITLE = columns["title"]
+    COL_DESC = columns["description"]
+    COL_FILE = columns["file"]
+    COL_PROCESSED = columns["processed"]
+    COL_THUMBNAIL = columns["thumbnail"]
+    COL_DRIVE_AUDIO_ID = columns["drive_audio_id"]
+    COL_IMAGE_16x9 = columns["image16x9"]
+
+    sheet_row_number = find_unprocessed_row(
+        scan_rows,
+        2,
+        today,
+    )
 
-    if target_row is None:
+    if sheet_row_number is None:
         print(
             "No episode scheduled for "
-            f"{today.isoformat()}, or all matching "
+            f"{today_iso}, or all matching "
             "episodes are already processed."
         )
         return
 
-    sheet_row_number = target_row + 1
+    detail_columns = [
+        COL_TITLE,
+        COL_DESC,
+        COL_FILE,
+        COL_IMAGE_16x9,
+    ]
+
+    if COL_THUMBNAIL:
+        detail_columns.append(COL_THUMBNAIL)
+
+    if COL_DRIVE_AUDIO_ID:
+        detail_columns.append(COL_DRIVE_AUDIO_ID)
+
+    detail_row = read_sheet_columns(
+        sheets_svc,
+        SPREADSHEET_ID,
+        SHEET_NAME,
+        [
+            col_index[column_name]
+            for column_name in detail_columns
+        ],
+        first_row=sheet_row_number,
+        last_row=sheet_row_number,
+    )[0]
+
+    row_data = dict(
+        zip(
+            detail_columns,
+            detail_row,
+        )
+    )
 
-    title = (
-        row_data[col_index[COL_TITLE]]
-        or ""
-    ).strip()
+    title = row_data[COL_TITLE].strip()
 
-    description = (
-        row_data[col_index[COL_DESC]]
-        or ""
-    ).strip()
+    description = row_data[COL_DESC].strip()
 
-    filename = (
-        row_data[col_index[COL_FILE]]
-        or ""
-    ).strip()
+    filename = row_data[COL_FILE].strip()
 
     thumbnail_filename = ""
 
     if COL_THUMBNAIL:
         thumbnail_filename = (
-            row_data[col_index[COL_THUMBNAIL]]
-            or ""
-        ).strip()
+            row_data[COL_THUMBNAIL].strip()
+        )
 
     image16x9_id = (
-        row_data[col_index[COL_IMAGE_16x9]]
-        or ""
-    ).strip()
+        row_data[COL_IMAGE_16x9].strip()
+    )
+
+    sheet_audio_file_id = ""
+
+    if COL_DRIVE_AUDIO_ID:
+        sheet_audio_file_id = (
+            row_data[COL_DRIVE_AUDIO_ID].strip()
+        )
 
     if not title:
         raise RuntimeError(
@@ -892,17 +1604,17 @@ def main():
     # -----------------------------
     # Download assets from Drive
     # -----------------------------
-    audio_file_id = drive_find_file_id(
-        drive_svc,
-        EPISODES_FOLDER_ID,
-        filename,
-    )
-
-    drive_download_file(
-        drive_svc,
-        audio_file_id,
-        local_audio,
-    )
+    # A Drive file ID filled in by hand in the optional
+    # DriveAudioFileId column skips the files.list lookup.
+    if sheet_audio_file_id:
+        print("Using DriveAudioFileId from sheet.")
+        audio_file_id = sheet_audio_file_id
+    else:
+        audio_file_id = drive_find_file_id(
+            drive_svc,
+            EPISODES_FOLDER_ID,
+            filename,
+        )
 
     selected_image_file_id = (
         resolve_thumbnail_file_id(
@@ -920,27 +1632,20 @@ def main():
         )
     )
 
-    drive_download_file(
-        drive_svc,
-        selected_image_file_id,
-        local_image,
-    )
-
-    # -----------------------------
-    # Render video
-    # -----------------------------
-    run_ffmpeg(
-        local_image,
-        local_audio,
-        local_video,
+    audio_size, _ = drive_download_files_parallel(
+        initial_creds,
+        [
+            (audio_file_id, local_audio),
+            (selected_image_file_id, local_image),
+        ],
     )
 
     # -----------------------------
-    # Upload artifacts
+    # Render video and upload artifacts
     # -----------------------------
     audio_blob_name = (
         f"{BUCKET_EPISODES_PREFIX}/"
-        f"{today.isoformat()}/"
+        f"{today_iso}/"
         f"{filename}"
     )
 
@@ -951,139 +1656,105 @@ def main():
 
     video_blob_name = (
         f"{BUCKET_EPISODES_PREFIX}/"
-        f"{today.isoformat()}/"
+        f"{today_iso}/"
         f"{video_filename}"
     )
 
-    print(
-        "Uploading audio to "
-        f"gs://{BUCKET_NAME}/{audio_blob_name}"
+    rss_blob = bucket.blob(
+        RSS_BLOB_NAME
     )
 
-    blob_audio = bucket.blob(
-        audio_blob_name
-    )
+    # The audio upload and the RSS download do not depend on the
+    # render, so they run in the background while ffmpeg encodes.
+    # The video upload starts as soon as the render finishes.
+    with ThreadPoolExecutor(
+        max_workers=3,
+    ) as executor:
+        audio_upload = executor.submit(
+            upload_public_file,
+            bucket,
+            audio_blob_name,
+            local_audio,
+            "audio/x-m4a",
+            600,
+            "audio",
+        )
 
-    blob_audio.upload_from_filename(
-        local_audio,
-        content_type="audio/x-m4a",
-        timeout=600,
-        retry=storage.retry.DEFAULT_RETRY,
-    )
+        rss_download = executor.submit(
+            fetch_rss_feed,
+            rss_blob,
+        )
 
-    try:
-        blob_audio.make_public()
-    except Exception as error:
-        print(
-            "Could not make audio object public. "
-            f"Continuing: {error}"
+        run_ffmpeg(
+            local_image,
+            local_audio,
+            local_video,
+            copy_audio=filename.lower().endswith(
+                AAC_AUDIO_EXTENSIONS
+            ),
         )
 
-    print(
-        "Uploading video to "
-        f"gs://{BUCKET_NAME}/{video_blob_name}"
-    )
+        video_upload = executor.submit(
+            upload_public_file,
+            bucket,
+            video_blob_name,
+            local_video,
+            "video/mp4",
+            1800,
+            "video",
+        )
 
-    blob_video = bucket.blob(
-        video_blob_name
-    )
+        blob_audio = audio_upload.result()
+        blob_video = video_upload.result()
 
-    blob_video.upload_from_filename(
-        local_video,
-        content_type="video/mp4",
-        timeout=1800,
-        retry=storage.retry.DEFAULT_RETRY,
-    )
+        # The prefetch is only a head start. If it fails (for
+        # example rss.xml changed between reload and download),
+        # publish_rss_item() fetches again under its own retries.
+        try:
+            rss_feed = rss_download.result()
+        except Exception as error:
+            print(
+                "Could not prefetch rss.xml. "
+                f"Continuing: {error}"
+            )
 
-    try:
-        blob_video.make_public()
-    except Exception as error:
-        print(
-            "Could not make video object public. "
-            f"Continuing: {error}"
-        )
+            rss_feed = None
 
     print("Audio and video uploads completed.")
 
     # -----------------------------
     # Update RSS safely
     # -----------------------------
-    rss_blob = bucket.blob(
-        RSS_BLOB_NAME
-    )
-
-    rss_xml = rss_blob.download_as_text(
-        timeout=120,
-        retry=storage.retry.DEFAULT_RETRY,
-    )
-
-    root = ET.fromstring(
-        rss_xml
-    )
-
-    channel = root.find("channel")
-
-    if channel is None:
-        raise RuntimeError(
-            "rss.xml is missing the <channel> element."
-        )
-
     guid_value = (
         f"dddevotion-"
-        f"{today.isoformat()}-"
+        f"{today_iso}-"
         f"{filename}"
     )
 
-    matching_items = remove_duplicate_items_for_guid(
-        channel,
+    new_item = build_rss_item(
+        title=title,
+        description=description,
+        audio_url=blob_audio.public_url,
+        audio_size=audio_size,
+        guid_value=guid_value,
+    )
+
+    rss_updated = publish_rss_item(
+        rss_blob,
         guid_value,
+        new_item,
+        prefetched_feed=rss_feed,
     )
 
-    if matching_items:
+    if not rss_updated:
         print(
-            "RSS item already exists. "
-            "Skipping duplicate insertion for GUID: "
-            f"{guid_value}"
+            "RSS feed unchanged. "
+            "Skipping rss.xml upload."
         )
     else:
-        new_item = build_rss_item(
-            title=title,
-            description=description,
-            audio_url=blob_audio.public_url,
-            audio_size=os.path.getsize(
-                local_audio
-            ),
-            guid_value=guid_value,
-        )
-
-        add_item_to_channel_newest_first(
-            channel,
-            new_item,
-        )
-
-        print(
-            "Added new RSS item for GUID: "
-            f"{guid_value}"
-        )
-
-    updated_xml = ET.tostring(
-        root,
-        encoding="unicode",
-    )
-
-    rss_blob.upload_from_string(
-        updated_xml,
-        content_type="application/xml",
-        timeout=120,
-        retry=storage.retry.DEFAULT_RETRY,
-    )
-
-    try:
-        rss_blob.make_public()
-    except Exception as error:
-        print(
-            "Could not make RSS object public. "
-            f"Continuing: {error}"
+        make_blob_public(
+            rss_blob,
+            "RSS",
         )
 
     print("RSS update completed.")
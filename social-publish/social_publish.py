@@ -2,6 +2,7 @@ import os
 import io
 import time
 import json
+import random
 import requests
 import google.auth
 
@@ -10,9 +11,9 @@ from typing import Dict, Optional, List, Tuple
 from urllib.parse import quote
 
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 from googleapiclient.http import MediaFileUpload
 from google.cloud import storage
-from google.oauth2.credentials import Credentials
 
 
 # -----------------------------
@@ -37,6 +38,10 @@ YOUTUBE_CLIENT_SECRET = os.getenv("YOUTUBE_CLIENT_SECRET")
 YOUTUBE_REFRESH_TOKEN = os.getenv("YOUTUBE_REFRESH_TOKEN")
 YOUTUBE_PRIVACY_STATUS = os.getenv("YOUTUBE_PRIVACY_STATUS", "public").strip().lower()  # public|unlisted|private
 
+# Lowercased sheet values that count as "yes" for the Processed / Social Published columns
+PROCESSED_VALUES = frozenset({"yes", "y", "true", "1", "processed", "done"})
+PUBLISHED_VALUES = frozenset({"yes", "y", "true", "1", "published", "done"})
+
 
 # -----------------------------
 # Auth (ADC for Sheets + Storage)
@@ -83,6 +88,81 @@ def try_header(col_index: Dict[str, int], *candidates: str) -> Optional[str]:
     return None
 
 
+def read_sheet_headers(sheets, sheet_id: str, sheet_name: str) -> List[str]:
+    resp = sheets.spreadsheets().values().get(
+        spreadsheetId=sheet_id,
+        range=f"'{sheet_name}'!1:1"
+    ).execute(num_retries=5)
+    values = resp.get("values", [])
+    return values[0] if values else []
+
+
+def read_sheet_columns(
+    sheets,
+    sheet_id: str,
+    sheet_name: str,
+    col_indexes: List[int],
+    first_row: int = 2,
+    last_row: Optional[int] = None,
+) -> List[List[str]]:
+    """Read only the given columns, zipped back into padded rows (row i is sheet row first_row + i)."""
+    end_row = "" if last_row is None else last_row
+    ranges = []
+    for i in col_indexes:
+        letter = col_to_a1(i)
+        ranges.append(f"'{sheet_name}'!{letter}{first_row}:{letter}{end_row}")
+
+    resp = sheets.spreadsheets().values().batchGet(
+        spreadsheetId=sheet_id,
+        ranges=ranges,
+        majorDimension="COLUMNS"
+    ).execute(num_retries=5)
+
+    columns = []
+    for vr in resp.get("valueRanges", []):
+        col_values = vr.get("values", [])
+        columns.append(col_values[0] if col_values else [])
+
+    if last_row is None:
+        row_count = max((len(c) for c in columns), default=0)
+    else:
+        row_count = last_row - first_row + 1
+    return [[c[r] if r < len(c) else "" for c in columns] for r in range(row_count)]
+
+
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+
+def batch_update_with_retry(sheet_id: str, data: List[dict], max_attempts: int = 6):
+    """
+    Write ranges with values.batchUpdate, backing off on transient errors.
+
+    Each attempt builds a fresh Sheets client so the write does not reuse a
+    connection that sat idle through the YouTube and Facebook uploads.
+    """
+    for attempt in range(1, max_attempts + 1):
+        try:
+            sheets = build("sheets", "v4", credentials=get_adc_creds())
+            sheets.spreadsheets().values().batchUpdate(
+                spreadsheetId=sheet_id,
+                body={"valueInputOption": "RAW", "data": data}
+            ).execute(num_retries=3)
+            return
+        except HttpError as e:
+            status = getattr(e.resp, "status", None)
+            print(f"Sheets update failed with HTTP {status} (attempt {attempt}/{max_attempts}).")
+            if status not in RETRYABLE_STATUS_CODES or attempt >= max_attempts:
+                raise
+        except OSError as e:
+            print(f"Sheets update connection error: {type(e).__name__}: {e} (attempt {attempt}/{max_attempts}).")
+            if attempt >= max_attempts:
+                raise
+
+        wait_seconds = min(2 ** attempt + random.random(), 32)
+        print(f"Retrying Sheets update in {wait_seconds:.1f} seconds.")
+        time.sleep(wait_seconds)
+
+
 # -----------------------------
 # GCS helpers
 # -----------------------------
@@ -103,6 +183,9 @@ def youtube_client():
     if not (YOUTUBE_CLIENT_ID and YOUTUBE_CLIENT_SECRET and YOUTUBE_REFRESH_TOKEN):
         raise RuntimeError("Missing YouTube OAuth env vars (YOUTUBE_CLIENT_ID/SECRET/REFRESH_TOKEN).")
 
+    # Imported here: only runs with YouTube configured need user OAuth creds.
+    from google.oauth2.credentials import Credentials
+
     creds = Credentials(
         token=None,
         refresh_token=YOUTUBE_REFRESH_TOKEN,
@@ -131,7 +214,7 @@ def upload_to_youtube(yt, video_path: str, title: str, description: str, privacy
 
     resp = None
     while resp is None:
-        _, resp = req.next_chunk()
+        _, resp = req.next_chunk(num_retries=5)
 
     video_id = resp["id"]
     return f"https://www.youtube.com/watch?v={video_id}"
@@ -163,10 +246,11 @@ def fb_upload_video_native(message: str, video_file_path: str) -> str:
     if not META_PAGE_ID or not META_PAGE_ACCESS_TOKEN:
         raise RuntimeError("Missing META_PAGE_ID / META_PAGE_ACCESS_TOKEN.")
 
-    if not os.path.exists(video_file_path):
+    try:
+        file_size = os.stat(video_file_path).st_size
+    except FileNotFoundError:
         raise RuntimeError(f"Video file not found: {video_file_path}")
 
-    file_size = os.path.getsize(video_file_path)
     print(f"[FB] Preparing native upload: {video_file_path}")
     print(f"[FB] File size: {file_size} bytes ({file_size / (1024 * 1024):.2f} MB)")
 
@@ -325,17 +409,11 @@ def main():
     storage_client = storage.Client(credentials=adc_creds)
     bucket = storage_client.bucket(BUCKET_NAME)
 
-    resp = sheets.spreadsheets().values().get(
-        spreadsheetId=SHEET_ID,
-        range=f"'{SHEET_NAME}'!A1:Z"
-    ).execute()
-
-    values = resp.get("values", [])
-    if not values:
+    headers = read_sheet_headers(sheets, SHEET_ID, SHEET_NAME)
+    if not headers:
         print("Sheet returned no data.")
         return
 
-    headers = values[0]
     col_index = {h.strip(): i for i, h in enumerate(headers)}
 
     COL_PUBLISH = pick_existing_header(col_index, "Publish Date", "PublishDate", "publish_date")
@@ -350,30 +428,55 @@ def main():
     COL_FB_ID = try_header(col_index, "FacebookPostId", "Facebook Post Id", "facebook_post_id")
     COL_SOCIAL_PUBLISHED = try_header(col_index, "SocialPublished", "Social Published", "social_published")
 
-    candidates: List[Tuple[int, List[str]]] = []
-    for r in range(1, len(values)):
-        row = values[r] + [""] * (len(headers) - len(values[r]))
+    # Scan only the status columns, then fetch the details for today's rows.
+    scan_columns = [COL_PUBLISH, COL_PROCESSED]
+    if COL_SOCIAL_PUBLISHED:
+        scan_columns.append(COL_SOCIAL_PUBLISHED)
+    scan_col = {name: i for i, name in enumerate(scan_columns)}
 
-        publish_raw = (row[col_index[COL_PUBLISH]] or "").strip()
-        if publish_raw != today_iso:
+    scan_rows = read_sheet_columns(sheets, SHEET_ID, SHEET_NAME, [col_index[c] for c in scan_columns])
+
+    pub_i = scan_col[COL_PUBLISH]
+    proc_i = scan_col[COL_PROCESSED]
+    social_i = scan_col.get(COL_SOCIAL_PUBLISHED)
+
+    candidate_rows: List[int] = []
+    for r, row in enumerate(scan_rows):
+        if row[pub_i].strip() != today_iso:
             continue
 
-        processed_val = (row[col_index[COL_PROCESSED]] or "").strip().lower()
-        is_processed = processed_val in ("yes", "y", "true", "1", "processed", "done")
+        processed_val = row[proc_i].strip().lower()
+        is_processed = processed_val in PROCESSED_VALUES
         if not is_processed:
             continue
 
-        if COL_SOCIAL_PUBLISHED:
-            published_val = (row[col_index[COL_SOCIAL_PUBLISHED]] or "").strip().lower()
-            if published_val in ("yes", "y", "true", "1", "published", "done"):
+        if social_i is not None:
+            published_val = row[social_i].strip().lower()
+            if published_val in PUBLISHED_VALUES:
                 continue
 
-        candidates.append((r, row))
+        candidate_rows.append(r + 2)
 
-    if not candidates:
+    if not candidate_rows:
         print(f"No rows to publish for {today_iso}.")
         return
 
+    detail_columns = [COL_TITLE, COL_DESC, COL_FILE]
+    first_row, last_row = candidate_rows[0], candidate_rows[-1]
+    detail_rows = read_sheet_columns(
+        sheets,
+        SHEET_ID,
+        SHEET_NAME,
+        [col_index[c] for c in detail_columns],
+        first_row=first_row,
+        last_row=last_row,
+    )
+
+    # (sheet row number, {column name: value})
+    candidates: List[Tuple[int, Dict[str, str]]] = [
+        (n, dict(zip(detail_columns, detail_rows[n - first_row]))) for n in candidate_rows
+    ]
+
     yt = None
     yt_enabled = all([YOUTUBE_CLIENT_ID, YOUTUBE_CLIENT_SECRET, YOUTUBE_REFRESH_TOKEN])
     if yt_enabled:
@@ -383,25 +486,25 @@ def main():
 
     os.makedirs("/tmp/dd", exist_ok=True)
 
-    for (row_idx, row) in candidates:
-        title = (row[col_index[COL_TITLE]] or "").strip()
-        desc = (row[col_index[COL_DESC]] or "").strip()
-        audio_filename = (row[col_index[COL_FILE]] or "").strip()
+    for (row_number, row) in candidates:
+        title = row[COL_TITLE].strip()
+        desc = row[COL_DESC].strip()
+        audio_filename = row[COL_FILE].strip()
 
         if not title or not audio_filename:
-            print(f"Skipping row {row_idx + 1}: missing title or file name.")
+            print(f"Skipping row {row_number}: missing title or file name.")
             continue
 
         video_object = derive_video_object(today_iso, audio_filename)
         blob = bucket.blob(video_object)
-        if not blob.exists(storage_client):
+        if not blob.exists(storage_client, retry=storage.retry.DEFAULT_RETRY):
             raise RuntimeError(f"Expected video not found: gs://{BUCKET_NAME}/{video_object}")
 
-        local_video = f"/tmp/dd/{row_idx + 1}.mp4"
-        blob.download_to_filename(local_video)
+        local_video = f"/tmp/dd/{row_number}.mp4"
+        blob.download_to_filename(local_video, timeout=600, retry=storage.retry.DEFAULT_RETRY)
 
         local_size = os.path.getsize(local_video)
-        print(f"Downloaded video for row {row_idx + 1}: {local_video} ({local_size / (1024 * 1024):.2f} MB)")
+        print(f"Downloaded video for row {row_number}: {local_video} ({local_size / (1024 * 1024):.2f} MB)")
 
         gcs_video_url = gcs_public_url(BUCKET_NAME, video_object)
 
@@ -431,28 +534,30 @@ def main():
             fb_link = yt_url or gcs_video_url
             fb_id = fb_post_link(message=social_post, link=fb_link)
 
-        def update_cell(col_name: str, value: str):
-            col_letter = col_to_a1(col_index[col_name])
-            a1 = f"'{SHEET_NAME}'!{col_letter}{row_idx + 1}"
-            sheets.spreadsheets().values().update(
-                spreadsheetId=SHEET_ID,
-                range=a1,
-                valueInputOption="RAW",
-                body={"values": [[value]]}
-            ).execute()
-
+        # All of the row's outputs go out in one values.batchUpdate call.
+        updates: Dict[str, str] = {}
         if COL_VIDEO_URL:
-            update_cell(COL_VIDEO_URL, gcs_video_url)
+            updates[COL_VIDEO_URL] = gcs_video_url
         if COL_YT_URL and yt_url:
-            update_cell(COL_YT_URL, yt_url)
+            updates[COL_YT_URL] = yt_url
         if COL_SOCIAL_POST and social_post:
-            update_cell(COL_SOCIAL_POST, social_post)
+            updates[COL_SOCIAL_POST] = social_post
         if COL_FB_ID and fb_id:
-            update_cell(COL_FB_ID, fb_id)
+            updates[COL_FB_ID] = fb_id
         if COL_SOCIAL_PUBLISHED:
-            update_cell(COL_SOCIAL_PUBLISHED, "yes")
-
-        print(f"Published row {row_idx + 1}: {title}")
+            updates[COL_SOCIAL_PUBLISHED] = "yes"
+
+        if updates:
+            data = [
+                {
+                    "range": f"'{SHEET_NAME}'!{col_to_a1(col_index[col_name])}{row_number}",
+                    "values": [[value]],
+                }
+                for col_name, value in updates.items()
+            ]
+            batch_update_with_retry(SHEET_ID, data)
+
+        print(f"Published row {row_number}: {title}")
         print("  GCS:", gcs_video_url)
         if yt_url:
             print("  YouTube:", yt_url)